@@ -3,13 +3,19 @@ API endpoints for PhotoSpot CRUD operations.
 Handles creation, retrieval, updating, and deletion of photo spots.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import or_, cast, func, insert, select
+from sqlalchemy.dialects.postgresql import JSONB
+from geoalchemy2 import Geography
 from typing import List, Optional
+from datetime import datetime
 
 from app.database import get_db
 from app.models.photo_spot import PhotoSpot
+from app.utils.cache import spot_cache, invalidate_spot
 from app.schemas.photo_spot import (
     PhotoSpotCreate,
     PhotoSpotUpdate,
@@ -19,11 +25,49 @@ from app.schemas.photo_spot import (
 
 router = APIRouter()
 
+# Built once: validates a whole bulk request body straight from JSON bytes
+BULK_CREATE_ADAPTER = TypeAdapter(List[PhotoSpotCreate])
+
+# Browse endpoints may be reused briefly by the client, then revalidated via ETag
+READ_CACHE_CONTROL = "private, max-age=10"
+
+
+def _make_etag(*parts) -> str:
+    """Build a weak ETag from version parts (IDs, counts, timestamps)"""
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+def _timestamp_key(value: Optional[datetime]) -> int:
+    """Microsecond timestamp for ETags (0 when missing)"""
+    return int(value.timestamp() * 1_000_000) if value else 0
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check the request's If-None-Match header against an ETag.
+    Uses weak comparison, as required for GET revalidation.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def _not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current validators"""
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": READ_CACHE_CONTROL}
+    )
+
 
 @router.post("/", response_model=PhotoSpotResponse, status_code=201)
-def create_photo_spot(
+async def create_photo_spot(
     spot: PhotoSpotCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new photo spot.
@@ -37,44 +81,108 @@ def create_photo_spot(
     """
     db_spot = PhotoSpot(**spot.model_dump())
     db.add(db_spot)
-    db.commit()
-    db.refresh(db_spot)
+    await db.commit()
+    await db.refresh(db_spot)
     return db_spot
 
 
+@router.post(
+    "/bulk",
+    response_model=List[PhotoSpotResponse],
+    status_code=201,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/PhotoSpotCreate"}}
+                }
+            }
+        }
+    }
+)
+async def bulk_create_photo_spots(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many photo spots in one INSERT ... RETURNING round trip.
+    Intended for seeding and imports where per-row commits are too slow.
+    The raw body is parsed and validated in one pydantic-core pass
+    (validate_json) instead of json.loads followed by model validation.
+    
+    Args:
+        request: Incoming request whose body is a JSON list of PhotoSpotCreate
+        db: Database session
+        
+    Returns:
+        Created PhotoSpots with IDs and timestamps, in request order
+        
+    Raises:
+        RequestValidationError: 422 if the body is invalid JSON or fails validation
+    """
+    try:
+        spots = BULK_CREATE_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        # Same error shape FastAPI produces for declared body parameters
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+    
+    if not spots:
+        return []
+    
+    # ORM bulk insert: rows are sent as a multi-row VALUES list with RETURNING
+    result = await db.scalars(
+        insert(PhotoSpot).returning(PhotoSpot, sort_by_parameter_order=True),
+        [spot.model_dump() for spot in spots]
+    )
+    db_spots = result.all()
+    await db.commit()
+    return db_spots
+
+
 @router.get("/", response_model=PhotoSpotList)
-def list_photo_spots(
+async def list_photo_spots(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(10, ge=1, le=100, description="Number of records to return"),
     search: Optional[str] = Query(None, description="Search by name, city, or country"),
     city: Optional[str] = Query(None, description="Filter by city"),
     category: Optional[str] = Query(None, description="Filter by category"),
     country: Optional[str] = Query(None, description="Filter by country"),
+    tag: Optional[str] = Query(None, description="Filter by tag (exact match)"),
     is_active: bool = Query(True, description="Include only active spots"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     List photo spots with optional filters and pagination.
+    Sends a weak ETag built from the filtered set's latest change and total;
+    a matching If-None-Match returns 304 without a body.
     
     Args:
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag/Cache-Control headers)
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
         search: General search term (searches name, city, and country)
         city: Optional city filter
         category: Optional category filter
         country: Optional country filter
+        tag: Optional tag filter (JSONB containment, served by the GIN index)
         is_active: Filter by active status
         db: Database session
         
     Returns:
-        Paginated list of PhotoSpots with total count
+        Paginated list of PhotoSpots with total count, highest overall score first
     """
-    query = db.query(PhotoSpot).filter(PhotoSpot.is_active == is_active)
+    filters = [PhotoSpot.is_active == is_active]
     
     # General search (searches across multiple fields)
     if search:
         search_pattern = f"%{search}%"
-        query = query.filter(
+        filters.append(
             or_(
                 PhotoSpot.name.ilike(search_pattern),
                 PhotoSpot.city.ilike(search_pattern),
@@ -84,17 +192,47 @@ def list_photo_spots(
     
     # Specific filters (can combine with search)
     if city:
-        query = query.filter(PhotoSpot.city.ilike(f"%{city}%"))
+        filters.append(PhotoSpot.city.ilike(f"%{city}%"))
     if category:
-        query = query.filter(PhotoSpot.category == category.lower())
+        filters.append(PhotoSpot.category == category.lower())
     if country:
-        query = query.filter(PhotoSpot.country.ilike(f"%{country}%"))
+        filters.append(PhotoSpot.country.ilike(f"%{country}%"))
+    if tag:
+        filters.append(PhotoSpot.tags.op("@>")(cast([tag], JSONB)))
     
-    # Get total count before pagination
-    total = query.count()
+    # Single statement: window aggregates return the total and the latest
+    # change time (for the ETag) alongside the page
+    last_modified = func.max(func.coalesce(PhotoSpot.updated_at, PhotoSpot.created_at))
+    stmt = (
+        select(
+            PhotoSpot,
+            func.count().over().label("total"),
+            last_modified.over().label("last_modified")
+        )
+        .where(*filters)
+        .order_by(PhotoSpot.overall_score.desc(), PhotoSpot.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    rows = (await db.execute(stmt)).all()
+    
+    if rows:
+        total, latest = rows[0].total, rows[0].last_modified
+    elif skip:
+        # Page is past the end, so there is no row to carry the window values
+        total, latest = (await db.execute(
+            select(func.count(), last_modified).select_from(PhotoSpot).where(*filters)
+        )).one()
+    else:
+        total, latest = 0, None
     
-    # Apply pagination
-    spots = query.offset(skip).limit(limit).all()
+    etag = _make_etag(_timestamp_key(latest), total)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = READ_CACHE_CONTROL
+    
+    spots = [row.PhotoSpot for row in rows]
     
     return {
         "total": total,
@@ -105,15 +243,21 @@ def list_photo_spots(
 
 
 @router.get("/{spot_id}", response_model=PhotoSpotResponse)
-def get_photo_spot(
+async def get_photo_spot(
     spot_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get a specific photo spot by ID.
+    Responses are served from a short-lived in-process cache when available,
+    and a matching If-None-Match (ETag from updated_at) returns 304.
     
     Args:
         spot_id: ID of the photo spot
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag/Cache-Control headers)
         db: Database session
         
     Returns:
@@ -122,17 +266,32 @@ def get_photo_spot(
     Raises:
         HTTPException: 404 if spot not found
     """
-    spot = db.query(PhotoSpot).filter(PhotoSpot.id == spot_id).first()
-    if not spot:
-        raise HTTPException(status_code=404, detail="Photo spot not found")
-    return spot
+    spot_response = spot_cache.get(spot_id)
+    if spot_response is None:
+        spot = await db.get(PhotoSpot, spot_id)
+        if not spot:
+            raise HTTPException(status_code=404, detail="Photo spot not found")
+        
+        spot_response = PhotoSpotResponse.model_validate(spot)
+        spot_cache[spot_id] = spot_response
+    
+    etag = _make_etag(
+        spot_id,
+        _timestamp_key(spot_response.updated_at or spot_response.created_at)
+    )
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = READ_CACHE_CONTROL
+    
+    return spot_response
 
 
 @router.put("/{spot_id}", response_model=PhotoSpotResponse)
-def update_photo_spot(
+async def update_photo_spot(
     spot_id: int,
     spot_update: PhotoSpotUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update an existing photo spot.
@@ -148,7 +307,7 @@ def update_photo_spot(
     Raises:
         HTTPException: 404 if spot not found
     """
-    db_spot = db.query(PhotoSpot).filter(PhotoSpot.id == spot_id).first()
+    db_spot = await db.get(PhotoSpot, spot_id)
     if not db_spot:
         raise HTTPException(status_code=404, detail="Photo spot not found")
     
@@ -157,16 +316,17 @@ def update_photo_spot(
     for field, value in update_data.items():
         setattr(db_spot, field, value)
     
-    db.commit()
-    db.refresh(db_spot)
+    await db.commit()
+    await db.refresh(db_spot)
+    invalidate_spot(spot_id)
     return db_spot
 
 
 @router.delete("/{spot_id}", status_code=204)
-def delete_photo_spot(
+async def delete_photo_spot(
     spot_id: int,
     hard_delete: bool = Query(False, description="Permanently delete instead of soft delete"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a photo spot (soft delete by default).
@@ -179,32 +339,34 @@ def delete_photo_spot(
     Raises:
         HTTPException: 404 if spot not found
     """
-    db_spot = db.query(PhotoSpot).filter(PhotoSpot.id == spot_id).first()
+    db_spot = await db.get(PhotoSpot, spot_id)
     if not db_spot:
         raise HTTPException(status_code=404, detail="Photo spot not found")
     
     if hard_delete:
         # Permanent deletion
-        db.delete(db_spot)
+        await db.delete(db_spot)
     else:
         # Soft delete
         db_spot.is_active = False
     
-    db.commit()
+    await db.commit()
+    invalidate_spot(spot_id)
     return None
 
 
 @router.get("/nearby/", response_model=List[PhotoSpotResponse])
-def get_nearby_spots(
+async def get_nearby_spots(
     latitude: float = Query(..., ge=-90, le=90, description="Current latitude"),
     longitude: float = Query(..., ge=-180, le=180, description="Current longitude"),
     radius_km: float = Query(10, ge=0.1, le=100, description="Search radius in kilometers"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Find photo spots near a given GPS coordinate.
-    Uses simple distance calculation (will be optimized with PostGIS in future).
+    Uses PostGIS ST_DWithin on the GiST-indexed geography column for the radius
+    filter and KNN (<->) ordering so results come back nearest first.
     
     Args:
         latitude: Current GPS latitude
@@ -216,18 +378,15 @@ def get_nearby_spots(
     Returns:
         List of nearby PhotoSpots sorted by distance
     """
-    # Simple bounding box filter (approximation)
-    # 1 degree latitude ≈ 111 km
-    # 1 degree longitude ≈ 111 km * cos(latitude)
-    import math
-    
-    lat_delta = radius_km / 111.0
-    lon_delta = radius_km / (111.0 * math.cos(math.radians(latitude)))
+    point = func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326).cast(
+        Geography(geometry_type="POINT", srid=4326)
+    )
     
-    spots = db.query(PhotoSpot).filter(
-        PhotoSpot.is_active == True,
-        PhotoSpot.latitude.between(latitude - lat_delta, latitude + lat_delta),
-        PhotoSpot.longitude.between(longitude - lon_delta, longitude + lon_delta)
-    ).limit(limit).all()
+    spots = await db.scalars(
+        select(PhotoSpot).where(
+            PhotoSpot.is_active == True,
+            func.ST_DWithin(PhotoSpot.geog, point, radius_km * 1000)
+        ).order_by(PhotoSpot.geog.op("<->")(point)).limit(limit)
+    )
     
-    return spots
\ No newline at end of file
+    return spots.all()
\ No newline at end of file
@@ -3,20 +3,26 @@ API endpoints for photo upload and user-generated content.
 Handles image upload, EXIF extraction, and PhotoSpot creation.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request
-from sqlalchemy.orm import Session
-from PIL import Image
-from PIL.ExifTags import TAGS, GPSTAGS
+from fastapi import APIRouter, BackgroundTasks, Depends, FastAPI, HTTPException, UploadFile, File, Form, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from PIL import Image, ExifTags
 from typing import Optional
+from concurrent.futures.process import BrokenProcessPool
+import aiofiles
+import asyncio
 import os
 import uuid
 import socket
 from datetime import datetime
 
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.models.photo_spot import PhotoSpot
 from app.schemas.photo_spot import PhotoSpotResponse
 from app.services.aesthetic_scorer import calculate_aesthetic_score
+from app.utils.cache import invalidate_spot
+from app.utils.images import create_thumbnail, create_thumbnail_executor
 import logging
 
 router = APIRouter()
@@ -28,112 +34,151 @@ THUMBNAIL_DIR = "uploads/thumbnails"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 os.makedirs(THUMBNAIL_DIR, exist_ok=True)
 
+# Uploads are written in 1 MB chunks and rejected once they pass the size cap
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_UPLOAD_SIZE = 50 * 1024 * 1024
+
+# Placeholder stored until background CLIP scoring finishes (same as scorer fallback)
+PENDING_AESTHETIC_SCORE = 70.0
+
+# Limit concurrent CLIP forward passes so bursts of uploads queue instead of
+# contending for the same model
+MAX_CONCURRENT_SCORING = 2
+_scoring_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCORING)
+
+
+# Server IP detected on first use (stable for the process lifetime)
+_server_ip = None
+
 
 def get_server_host() -> str:
     """
     Get the server's actual IP address on the local network.
     This is more reliable than using .local hostnames for iOS.
+    The detected IP is cached so the socket lookup runs once per process;
+    failures are not cached and are retried on the next call.
     """
+    global _server_ip
+    
+    if _server_ip is not None:
+        return _server_ip
+    
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
         local_ip = s.getsockname()[0]
         s.close()
-        print(f"Detected server IP: {local_ip}")
+        logger.debug("Detected server IP: %s", local_ip)
+        _server_ip = local_ip
         return local_ip
     except Exception as e:
-        print(f"Warning: Could not determine local IP: {e}")
+        logger.warning("Could not determine local IP: %s", e)
         return "localhost"
 
 
-def extract_gps_from_exif(exif_data):
-    """Extract GPS coordinates from EXIF data"""
-    gps_info = {}
-    
+# Sign applied for hemisphere refs; some cameras write the ref as bytes
+GPS_REF_SIGN = {"S": -1.0, b"S": -1.0, "W": -1.0, b"W": -1.0}
+
+
+def extract_gps_from_exif(exif_data: Image.Exif):
+    """Extract GPS coordinates from EXIF data via direct GPS IFD lookups"""
     if not exif_data:
         return None, None
     
-    for tag, value in exif_data.items():
-        tag_name = TAGS.get(tag, tag)
-        if tag_name == "GPSInfo":
-            for key in value.keys():
-                gps_tag = GPSTAGS.get(key, key)
-                gps_info[gps_tag] = value[key]
-    
+    gps_info = exif_data.get_ifd(ExifTags.IFD.GPSInfo)
     if not gps_info:
         return None, None
     
     def convert_to_degrees(value):
-        d, m, s = value
-        return d + (m / 60.0) + (s / 3600.0)
+        # Convert the IFDRational triple to floats once instead of dividing rationals
+        d, m, s = map(float, value)
+        return d + m * (1 / 60.0) + s * (1 / 3600.0)
     
     try:
-        lat = convert_to_degrees(gps_info.get("GPSLatitude", [0, 0, 0]))
-        lon = convert_to_degrees(gps_info.get("GPSLongitude", [0, 0, 0]))
+        lat = convert_to_degrees(gps_info.get(ExifTags.GPS.GPSLatitude, (0, 0, 0)))
+        lon = convert_to_degrees(gps_info.get(ExifTags.GPS.GPSLongitude, (0, 0, 0)))
         
-        if gps_info.get("GPSLatitudeRef") == "S":
-            lat = -lat
-        if gps_info.get("GPSLongitudeRef") == "W":
-            lon = -lon
+        lat *= GPS_REF_SIGN.get(gps_info.get(ExifTags.GPS.GPSLatitudeRef), 1.0)
+        lon *= GPS_REF_SIGN.get(gps_info.get(ExifTags.GPS.GPSLongitudeRef), 1.0)
         
         return lat, lon
     except:
         return None, None
 
 
-def extract_camera_params(exif_data):
-    """Extract camera parameters from EXIF"""
+def extract_camera_params(exif_data: Image.Exif):
+    """Extract camera parameters from EXIF via direct tag lookups"""
     params = {}
     
     if not exif_data:
         return params
     
-    for tag, value in exif_data.items():
-        tag_name = TAGS.get(tag, tag)
-        
-        if tag_name == "ISOSpeedRatings":
-            params["iso"] = value
-        elif tag_name == "FNumber":
-            params["aperture"] = f"f/{value}"
-        elif tag_name == "ExposureTime":
-            params["shutter_speed"] = f"1/{int(1/value)}" if value < 1 else f"{value}s"
-        elif tag_name == "FocalLength":
-            params["focal_length"] = f"{value}mm"
-        elif tag_name == "Make":
-            params["camera_make"] = value
-        elif tag_name == "Model":
-            params["camera_model"] = value
+    # Make/Model live in IFD0, exposure settings in the Exif sub-IFD
+    exif_ifd = exif_data.get_ifd(ExifTags.IFD.Exif)
+    
+    iso = exif_ifd.get(ExifTags.Base.ISOSpeedRatings)
+    if iso is not None:
+        params["iso"] = iso
+    f_number = exif_ifd.get(ExifTags.Base.FNumber)
+    if f_number is not None:
+        params["aperture"] = f"f/{f_number}"
+    exposure_time = exif_ifd.get(ExifTags.Base.ExposureTime)
+    if exposure_time is not None:
+        params["shutter_speed"] = f"1/{int(1/exposure_time)}" if exposure_time < 1 else f"{exposure_time}s"
+    focal_length = exif_ifd.get(ExifTags.Base.FocalLength)
+    if focal_length is not None:
+        params["focal_length"] = f"{focal_length}mm"
+    make = exif_data.get(ExifTags.Base.Make)
+    if make is not None:
+        params["camera_make"] = make
+    model = exif_data.get(ExifTags.Base.Model)
+    if model is not None:
+        params["camera_model"] = model
     
     return params
 
 
-def create_thumbnail(source_path: str, thumbnail_path: str, size: tuple = (300, 300)):
+def _replace_thumbnail_executor(app: FastAPI, broken):
     """
-    Create a thumbnail from the source image.
-    Maintains aspect ratio and uses high-quality resampling.
+    Swap a broken thumbnail pool (e.g. a worker was OOM-killed) for a new one.
+    Only the first upload to see a given pool break replaces it.
     """
+    if app.state.thumbnail_executor is broken:
+        app.state.thumbnail_executor = create_thumbnail_executor()
+        broken.shutdown(wait=False)
+
+
+async def score_and_update(spot_id: int, file_path: str, category: str):
+    """
+    Calculate the CLIP aesthetic score for an uploaded photo and store it.
+    Runs as a background task with its own database session.
+    """
+    logger.info("Calculating aesthetic score for spot %s...", spot_id)
     try:
-        with Image.open(source_path) as img:
-            # Convert RGBA to RGB if necessary
-            if img.mode == 'RGBA':
-                img = img.convert('RGB')
-            
-            # Create thumbnail maintaining aspect ratio
-            img.thumbnail(size, Image.Resampling.LANCZOS)
-            
-            # Save thumbnail with good quality
-            img.save(thumbnail_path, 'JPEG', quality=85, optimize=True)
-            
-            print(f"Thumbnail created: {thumbnail_path} ({img.size[0]}x{img.size[1]})")
-            return True
+        async with _scoring_semaphore:
+            # CLIP inference is CPU/GPU bound, keep it off the event loop
+            aesthetic_score, score_breakdown = await run_in_threadpool(
+                calculate_aesthetic_score, file_path, category
+            )
+        logger.info("CLIP aesthetic score: %.2f", aesthetic_score)
+        logger.info("Score breakdown: %s", score_breakdown)
+        
+        async with SessionLocal() as db:
+            await db.execute(
+                update(PhotoSpot)
+                .where(PhotoSpot.id == spot_id)
+                .values(aesthetic_score=aesthetic_score)
+            )
+            await db.commit()
+        invalidate_spot(spot_id)
     except Exception as e:
-        print(f"Error creating thumbnail: {e}")
-        return False
+        logger.warning("CLIP scoring failed for spot %s, keeping default: %s", spot_id, e)
 
 
 @router.post("/upload", response_model=PhotoSpotResponse, status_code=201)
 async def upload_photo_spot(
     request: Request,
+    background_tasks: BackgroundTasks,
     name: str = Form(..., description="Name of the photo spot"),
     description: Optional[str] = Form(None),
     category: str = Form(...),
@@ -144,11 +189,12 @@ async def upload_photo_spot(
     equipment_needed: Optional[str] = Form(None),
     tags: Optional[str] = Form(None, description="Comma-separated tags"),
     photo: UploadFile = File(..., description="Photo file"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Upload a photo and create a new PhotoSpot.
     Automatically generates thumbnail for better performance.
+    CLIP aesthetic scoring runs as a background task after the response is sent.
     """
     
     # Validate file type
@@ -163,26 +209,54 @@ async def upload_photo_spot(
     file_path = os.path.join(UPLOAD_DIR, unique_filename)
     thumbnail_path = os.path.join(THUMBNAIL_DIR, thumbnail_filename)
     
-    # Save original file
+    # Save original file, streaming in chunks so the photo is never fully in memory
     try:
-        with open(file_path, "wb") as f:
-            content = await photo.read()
-            f.write(content)
+        file_size = 0
+        async with aiofiles.open(file_path, "wb") as f:
+            while chunk := await photo.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > MAX_UPLOAD_SIZE:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File exceeds maximum size of {MAX_UPLOAD_SIZE // (1024 * 1024)} MB"
+                    )
+                await f.write(chunk)
         
-        file_size = os.path.getsize(file_path)
-        print(f"Photo saved: {file_path} ({file_size:,} bytes)")
+        logger.debug("Photo saved: %s (%d bytes)", file_path, file_size)
         
-        # Verify image and get dimensions
+        # Verify image, get dimensions and read EXIF from the same open file
+        exif_data = None
         with Image.open(file_path) as img:
             width, height = img.size
-            print(f"Image dimensions: {width}x{height}")
+            logger.debug("Image dimensions: %dx%d", width, height)
             
             if width == 0 or height == 0:
                 raise ValueError("Invalid image dimensions")
+            
+            try:
+                exif_data = img.getexif()
+            except Exception as e:
+                logger.warning("Could not extract EXIF: %s", e)
         
-        # Create thumbnail
-        thumbnail_created = create_thumbnail(file_path, thumbnail_path)
+        # Create thumbnail in the process pool so decode/resample does not block the event loop
+        executor = getattr(request.app.state, "thumbnail_executor", None)
+        try:
+            thumbnail_created = await asyncio.get_running_loop().run_in_executor(
+                executor,
+                create_thumbnail,
+                file_path,
+                thumbnail_path
+            )
+        except BrokenProcessPool:
+            # The upload itself is fine: rebuild the pool and make this thumbnail in a thread
+            logger.warning("Thumbnail process pool is broken, recreating it")
+            _replace_thumbnail_executor(request.app, executor)
+            thumbnail_created = await run_in_threadpool(create_thumbnail, file_path, thumbnail_path)
         
+    except HTTPException:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        raise
     except Exception as e:
         if os.path.exists(file_path):
             os.remove(file_path)
@@ -192,9 +266,6 @@ async def upload_photo_spot(
     camera_params = {}
     equipment_from_exif = ""
     try:
-        image = Image.open(file_path)
-        exif_data = image._getexif()
-        
         if exif_data:
             camera_params = extract_camera_params(exif_data)
             equipment_info = f"{camera_params.get('camera_make', '')} {camera_params.get('camera_model', '')}".strip()
@@ -211,24 +282,13 @@ async def upload_photo_spot(
             
             equipment_from_exif = ", ".join(equipment_parts) if equipment_parts else equipment_info
             if equipment_from_exif:
-                print(f"EXIF camera params: {equipment_from_exif}")
+                logger.debug("EXIF camera params: %s", equipment_from_exif)
     except Exception as e:
-        print(f"Warning: Could not extract EXIF: {e}")
+        logger.warning("Could not extract EXIF: %s", e)
     
     final_equipment = equipment_needed if equipment_needed else equipment_from_exif
     tag_list = [tag.strip() for tag in tags.split(",")] if tags else []
 
-    # Calculate aesthetic score
-    logger.info("Calculating aesthetic score...")
-    try:
-        aesthetic_score, score_breakdown = calculate_aesthetic_score(file_path, category)
-        logger.info(f"CLIP aesthetic score: {aesthetic_score:.2f}")
-        logger.info(f"Score breakdown: {score_breakdown}")
-    except Exception as e:
-        logger.warning(f"CLIP scoring failed, using default: {e}")
-        aesthetic_score = 70.0
-        score_breakdown = {"error": str(e)}
-    
     # Construct URLs
     host = request.headers.get("host")
     
@@ -239,16 +299,16 @@ async def upload_photo_spot(
             host = f"{server_ip}:{port}"
         else:
             host = f"{server_ip}:8002"
-        print(f"Converted .local hostname to IP: {host}")
+        logger.debug("Converted .local hostname to IP: %s", host)
     
     scheme = request.url.scheme
     base_url = f"{scheme}://{host}"
     image_url = f"{base_url}/uploads/photos/{unique_filename}"
     thumbnail_url = f"{base_url}/uploads/thumbnails/{thumbnail_filename}" if thumbnail_created else None
     
-    print(f"Generated image URL: {image_url}")
+    logger.debug("Generated image URL: %s", image_url)
     if thumbnail_url:
-        print(f"Generated thumbnail URL: {thumbnail_url}")
+        logger.debug("Generated thumbnail URL: %s", thumbnail_url)
     
     # Create PhotoSpot
     db_spot = PhotoSpot(
@@ -261,7 +321,7 @@ async def upload_photo_spot(
         category=category.lower(),
         image_url=image_url,
         thumbnail_url=thumbnail_url,
-        aesthetic_score=aesthetic_score,  # Use CLIP score instead of 70.0
+        aesthetic_score=PENDING_AESTHETIC_SCORE,  # Replaced by background CLIP scoring
         popularity_score=50.0,
         difficulty_level=difficulty_level.lower(),
         best_time=best_time,
@@ -272,14 +332,14 @@ async def upload_photo_spot(
     
     try:
         db.add(db_spot)
-        db.commit()
-        db.refresh(db_spot)
-        print(f"PhotoSpot created successfully:")
-        print(f"  ID: {db_spot.id}")
-        print(f"  Name: {db_spot.name}")
-        print(f"  Image URL: {db_spot.image_url}")
-        print(f"  Thumbnail URL: {db_spot.thumbnail_url}")
-        print(f"  Location: ({db_spot.latitude}, {db_spot.longitude})")
+        await db.commit()
+        await db.refresh(db_spot)
+        logger.info("PhotoSpot created: id=%s, name='%s'", db_spot.id, db_spot.name)
+        logger.debug(
+            "PhotoSpot %s image=%s thumbnail=%s location=(%s, %s)",
+            db_spot.id, db_spot.image_url, db_spot.thumbnail_url,
+            db_spot.latitude, db_spot.longitude
+        )
     except Exception as e:
         if os.path.exists(file_path):
             os.remove(file_path)
@@ -287,4 +347,6 @@ async def upload_photo_spot(
             os.remove(thumbnail_path)
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     
+    background_tasks.add_task(score_and_update, db_spot.id, file_path, db_spot.category)
+    
     return db_spot
\ No newline at end of file
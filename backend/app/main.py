@@ -4,13 +4,16 @@ Provides REST API endpoints for photo spot recommendations and AR guidance.
 """
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 import logging
 import os
 
-from app.database import engine, Base
+from app.database import engine, init_db
+from app.services.aesthetic_scorer import get_aesthetic_scorer
+from app.utils.images import create_thumbnail_executor
+from app.utils.static_files import ImmutableStaticFiles
 
 # Configure logging
 logging.basicConfig(
@@ -24,17 +27,29 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
-    Creates database tables on startup.
+    Creates database tables and the thumbnail process pool and loads the CLIP
+    scorer on startup, shuts down the pool and disposes the engine on shutdown.
     """
     logger.info("Starting up application...")
 
-    # Create database tables
-    Base.metadata.create_all(bind=engine)
+    # Create database extensions and tables
+    await init_db()
     logger.info("Database tables created successfully")
 
+    # Process pool for CPU-bound thumbnail generation (escapes the GIL)
+    app.state.thumbnail_executor = create_thumbnail_executor()
+
+    # Load CLIP weights during boot rather than on the first upload
+    try:
+        await run_in_threadpool(get_aesthetic_scorer)
+    except Exception as e:
+        logger.warning("CLIP scorer preload failed, will retry on first upload: %s", e)
+
     yield
 
     logger.info("Shutting down application...")
+    app.state.thumbnail_executor.shutdown(wait=True)
+    await engine.dispose()
 
 
 # Initialize FastAPI application
@@ -48,6 +63,8 @@ app = FastAPI(
 )
 
 # Configure CORS
+# Explicit method/header lists keep preflight checks to simple membership tests
+# (If-None-Match is needed for ETag revalidation of the spot endpoints)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -55,8 +72,8 @@ app.add_middleware(
         "http://localhost:3001",
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type", "if-none-match"],
 )
 
 
@@ -91,23 +108,29 @@ from app.api import spots, upload
 app.include_router(spots.router, prefix="/api/spots", tags=["Photo Spots"])
 app.include_router(upload.router, prefix="/api", tags=["Upload"])
 
-# Mount static files for uploaded photos
-if os.path.exists("uploads/photos"):
-    app.mount("/uploads/photos", StaticFiles(directory="uploads/photos"), name="photos")
-    logger.info("Static files mounted at /uploads/photos")
-else:
-    logger.warning("uploads/photos directory does not exist, creating it...")
-    os.makedirs("uploads/photos", exist_ok=True)
-    app.mount("/uploads/photos", StaticFiles(directory="uploads/photos"), name="photos")
-
-# Mount thumbnails directory
-if os.path.exists("uploads/thumbnails"):
-    app.mount("/uploads/thumbnails", StaticFiles(directory="uploads/thumbnails"), name="thumbnails")
-    logger.info("Static files mounted at /uploads/thumbnails")
+# Serve uploads from FastAPI unless a reverse proxy (Nginx/CDN) handles /uploads/
+SERVE_UPLOADS = os.getenv("SERVE_UPLOADS", "true").lower() == "true"
+
+if SERVE_UPLOADS:
+    # Mount static files for uploaded photos
+    if os.path.exists("uploads/photos"):
+        app.mount("/uploads/photos", ImmutableStaticFiles(directory="uploads/photos"), name="photos")
+        logger.info("Static files mounted at /uploads/photos")
+    else:
+        logger.warning("uploads/photos directory does not exist, creating it...")
+        os.makedirs("uploads/photos", exist_ok=True)
+        app.mount("/uploads/photos", ImmutableStaticFiles(directory="uploads/photos"), name="photos")
+
+    # Mount thumbnails directory
+    if os.path.exists("uploads/thumbnails"):
+        app.mount("/uploads/thumbnails", ImmutableStaticFiles(directory="uploads/thumbnails"), name="thumbnails")
+        logger.info("Static files mounted at /uploads/thumbnails")
+    else:
+        logger.warning("uploads/thumbnails directory does not exist, creating it...")
+        os.makedirs("uploads/thumbnails", exist_ok=True)
+        app.mount("/uploads/thumbnails", ImmutableStaticFiles(directory="uploads/thumbnails"), name="thumbnails")
 else:
-    logger.warning("uploads/thumbnails directory does not exist, creating it...")
-    os.makedirs("uploads/thumbnails", exist_ok=True)
-    app.mount("/uploads/thumbnails", StaticFiles(directory="uploads/thumbnails"), name="thumbnails")
+    logger.info("SERVE_UPLOADS=false, /uploads/ is expected to be served by the reverse proxy")
 
 # Additional routers will be added in future phases:
 # app.include_router(recommendations.router, prefix="/api/recommendations", tags=["Recommendations"])
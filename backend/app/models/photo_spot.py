@@ -4,9 +4,12 @@ Stores information about photography locations including GPS coordinates,
 images, ratings, and metadata for the recommendation engine.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, Computed, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
+from geoalchemy2 import Geography
 from app.database import Base
 
 
@@ -20,6 +23,7 @@ class PhotoSpot(Base):
         description: Detailed description of the location
         latitude: GPS latitude coordinate
         longitude: GPS longitude coordinate
+        geog: PostGIS geography point generated from latitude/longitude
         city: City name
         country: Country name
         category: Type of spot (landscape, architecture, street, etc.)
@@ -27,15 +31,32 @@ class PhotoSpot(Base):
         thumbnail_url: URL to thumbnail image
         aesthetic_score: AI-generated aesthetic score (0-100)
         popularity_score: User engagement score (0-100)
+        overall_score: Generated recommendation score (60% aesthetic, 40% popularity)
         difficulty_level: Access difficulty (easy, moderate, hard)
         best_time: Best time to visit (sunrise, sunset, golden_hour, etc.)
         equipment_needed: Recommended photography equipment
-        tags: JSON array of tags for filtering
+        tags: JSONB array of tags for filtering
         is_active: Soft delete flag
         created_at: Timestamp of creation
         updated_at: Timestamp of last update
     """
     __tablename__ = "photo_spots"
+    __table_args__ = (
+        # GiST index drives both ST_DWithin radius filtering and <-> KNN ordering
+        Index("photo_spots_geog_gix", "geog", postgresql_using="gist"),
+        # Trigram GIN indexes back the ILIKE '%term%' search in list_photo_spots
+        Index("spots_name_trgm", "name", postgresql_using="gin",
+              postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("spots_city_trgm", "city", postgresql_using="gin",
+              postgresql_ops={"city": "gin_trgm_ops"}),
+        Index("spots_country_trgm", "country", postgresql_using="gin",
+              postgresql_ops={"country": "gin_trgm_ops"}),
+        # Composite index for the common is_active + category filter
+        Index("spots_active_cat", "is_active", "category"),
+        # jsonb_path_ops GIN index serves tags @> '["sunset"]' containment filters
+        Index("spots_tags_gin", "tags", postgresql_using="gin",
+              postgresql_ops={"tags": "jsonb_path_ops"}),
+    )
 
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -44,11 +65,22 @@ class PhotoSpot(Base):
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
 
-    # Location data
-    latitude = Column(Float, nullable=False, index=True)
-    longitude = Column(Float, nullable=False, index=True)
+    # Location data (radius/KNN search goes through the geog GiST index instead
+    # of B-trees on latitude/longitude)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
     city = Column(String(100), nullable=True, index=True)
     country = Column(String(100), nullable=True, index=True)
+    # Deferred: only used in SQL predicates/ordering and never serialized, so
+    # loading a PhotoSpot does not fetch and decode the WKB
+    geog = deferred(Column(
+        Geography(geometry_type="POINT", srid=4326, spatial_index=False),
+        Computed(
+            "ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography",
+            persisted=True
+        ),
+        comment="Generated from latitude/longitude for spatial queries"
+    ))
 
     # Categorization
     category = Column(
@@ -73,6 +105,16 @@ class PhotoSpot(Base):
         default=0.0,
         comment="User engagement score 0-100"
     )
+    # Stored generated column so recommendation queries can sort on an index
+    # (see spots_active_score below)
+    overall_score = Column(
+        Float,
+        Computed(
+            "COALESCE(aesthetic_score, 0) * 0.6 + COALESCE(popularity_score, 0) * 0.4",
+            persisted=True
+        ),
+        comment="Overall recommendation score: 60% aesthetic + 40% popularity"
+    )
 
     # Practical information
     difficulty_level = Column(
@@ -93,7 +135,7 @@ class PhotoSpot(Base):
 
     # Flexible metadata
     tags = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Array of tags for filtering and search"
     )
@@ -106,18 +148,6 @@ class PhotoSpot(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Computed properties using hybrid_property (avoids Pydantic validation issues)
-    @hybrid_property
-    def overall_score(self) -> float:
-        """
-        Calculate overall recommendation score combining aesthetic and popularity.
-        This is a computed property that Pydantic can read as an attribute.
-
-        Returns:
-            float: Overall score (0-100)
-        """
-        # Weight: 60% aesthetic, 40% popularity
-        return (self.aesthetic_score * 0.6) + (self.popularity_score * 0.4)
-
     @hybrid_property
     def location_display(self) -> str:
         """
@@ -135,4 +165,10 @@ class PhotoSpot(Base):
         return "Unknown Location"
 
     def __repr__(self):
-        return f"<PhotoSpot(id={self.id}, name='{self.name}', city='{self.city}')>"
\ No newline at end of file
+        return f"<PhotoSpot(id={self.id}, name='{self.name}', city='{self.city}')>"
+
+
+# Matches list_photo_spots' WHERE is_active = ... ORDER BY overall_score DESC, id
+# LIMIT n, so a page is read straight off the index (declared after the class
+# because it needs the DESC column expression)
+Index("spots_active_score", PhotoSpot.is_active, PhotoSpot.overall_score.desc(), PhotoSpot.id)
\ No newline at end of file
@@ -3,20 +3,37 @@ Pydantic schemas for PhotoSpot API requests and responses.
 Handles data validation and serialization.
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+from typing import Annotated, Literal, Optional, List, Tuple
 from datetime import datetime
 
+# Allowed values as Literal types, validated natively by pydantic-core
+Category = Literal['landscape', 'architecture', 'street', 'nature', 'urban',
+                   'wildlife', 'portrait', 'night', 'aerial', 'other']
+Difficulty = Literal['easy', 'moderate', 'hard']
+
+
+def _lowercase(v):
+    """Lowercase string input before Literal validation (other types fail the Literal check)"""
+    return v.lower() if isinstance(v, str) else v
+
+
+CategoryField = Annotated[Category, BeforeValidator(_lowercase)]
+DifficultyField = Annotated[Difficulty, BeforeValidator(_lowercase)]
+
 
 class PhotoSpotBase(BaseModel):
     """Base schema with common PhotoSpot attributes"""
+    # defer_build moves core-schema construction from import time to first use
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(..., min_length=1, max_length=255, description="Name of the photo spot")
     description: Optional[str] = Field(None, description="Detailed description")
     latitude: float = Field(..., ge=-90, le=90, description="GPS latitude (-90 to 90)")
     longitude: float = Field(..., ge=-180, le=180, description="GPS longitude (-180 to 180)")
     city: Optional[str] = Field(None, max_length=100)
     country: Optional[str] = Field(None, max_length=100)
-    category: str = Field(
+    category: CategoryField = Field(
         ...,
         description="Category: landscape, architecture, street, nature, urban, etc."
     )
@@ -34,7 +51,7 @@ class PhotoSpotBase(BaseModel):
         le=100,
         description="User engagement score 0-100"
     )
-    difficulty_level: Optional[str] = Field(
+    difficulty_level: Optional[DifficultyField] = Field(
         default="moderate",
         description="Access difficulty: easy, moderate, hard"
     )
@@ -43,28 +60,8 @@ class PhotoSpotBase(BaseModel):
         description="Best time: sunrise, sunset, golden_hour, blue_hour, etc."
     )
     equipment_needed: Optional[str] = None
-    tags: Optional[List[str]] = Field(default_factory=list)
-
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, v: str) -> str:
-        """Validate category is one of the allowed values"""
-        allowed = ['landscape', 'architecture', 'street', 'nature', 'urban',
-                   'wildlife', 'portrait', 'night', 'aerial', 'other']
-        if v.lower() not in allowed:
-            raise ValueError(f'Category must be one of: {", ".join(allowed)}')
-        return v.lower()
-
-    @field_validator('difficulty_level')
-    @classmethod
-    def validate_difficulty(cls, v: Optional[str]) -> Optional[str]:
-        """Validate difficulty level"""
-        if v is None:
-            return v
-        allowed = ['easy', 'moderate', 'hard']
-        if v.lower() not in allowed:
-            raise ValueError(f'Difficulty must be one of: {", ".join(allowed)}')
-        return v.lower()
+    # Immutable shared default and a single (non-union) sequence schema
+    tags: Tuple[str, ...] = ()
 
 
 class PhotoSpotCreate(PhotoSpotBase):
@@ -74,32 +71,57 @@ class PhotoSpotCreate(PhotoSpotBase):
 
 class PhotoSpotUpdate(BaseModel):
     """Schema for updating an existing PhotoSpot (all fields optional)"""
+    model_config = ConfigDict(defer_build=True)
+
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
     latitude: Optional[float] = Field(None, ge=-90, le=90)
     longitude: Optional[float] = Field(None, ge=-180, le=180)
     city: Optional[str] = Field(None, max_length=100)
     country: Optional[str] = Field(None, max_length=100)
-    category: Optional[str] = None
+    category: Optional[CategoryField] = None
     image_url: Optional[str] = Field(None, max_length=500)
     thumbnail_url: Optional[str] = Field(None, max_length=500)
     aesthetic_score: Optional[float] = Field(None, ge=0, le=100)
     popularity_score: Optional[float] = Field(None, ge=0, le=100)
-    difficulty_level: Optional[str] = None
+    difficulty_level: Optional[DifficultyField] = None
     best_time: Optional[str] = None
     equipment_needed: Optional[str] = None
-    tags: Optional[List[str]] = None
+    tags: Optional[Tuple[str, ...]] = None  # None = leave unchanged
     is_active: Optional[bool] = None
 
 
-class PhotoSpotResponse(PhotoSpotBase):
-    """Schema for PhotoSpot responses (includes database fields and computed properties)"""
+class PhotoSpotResponse(BaseModel):
+    """
+    Schema for PhotoSpot responses (includes database fields and computed properties).
+    Output-only: values come from the database, which already enforced the input
+    constraints, so fields are plain types without ge/le/length or Literal checks.
+    """
+    # Allows conversion from SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
     id: int
+    name: str
+    description: Optional[str] = None
+    latitude: float
+    longitude: float
+    city: Optional[str] = None
+    country: Optional[str] = None
+    category: str
+    image_url: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    aesthetic_score: Optional[float] = 0.0
+    popularity_score: Optional[float] = 0.0
+    difficulty_level: Optional[str] = "moderate"
+    best_time: Optional[str] = None
+    equipment_needed: Optional[str] = None
+    # Rows inserted outside the API may have NULL tags
+    tags: Optional[Tuple[str, ...]] = ()
     is_active: bool
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    # Computed properties from hybrid_property in model
+    # Generated column and hybrid_property values from the model
     overall_score: float = Field(
         description="Computed overall score (60% aesthetic + 40% popularity)"
     )
@@ -107,12 +129,11 @@ class PhotoSpotResponse(PhotoSpotBase):
         description="Formatted location string (City, Country)"
     )
 
-    class Config:
-        from_attributes = True  # Allows conversion from SQLAlchemy models
-
 
 class PhotoSpotList(BaseModel):
     """Schema for paginated list of PhotoSpots"""
+    model_config = ConfigDict(defer_build=True)
+
     total: int
     page: int
     page_size: int
@@ -15,13 +15,54 @@ Design rationale:
 
 import torch
 import clip
+from torch.utils.data import DataLoader, Dataset
 from PIL import Image
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+import hashlib
 import logging
+import os
+import threading
+from cachetools import LRUCache
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 
 logger = logging.getLogger(__name__)
 
+# Minimum decode size requested from JPEG draft mode (CLIP input is 224px)
+DRAFT_SIZE = 256
+
+# Largest image (after draft scaling) decoded for scoring: 40MP
+MAX_DECODE_PIXELS = 40_000_000
+
+
+class _ImagePathDataset(Dataset):
+    """Loads and preprocesses images by path (module-level so workers can pickle it)"""
+    
+    def __init__(self, image_paths: List[str], preprocess):
+        self.image_paths = image_paths
+        self.preprocess = preprocess
+    
+    def __len__(self) -> int:
+        return len(self.image_paths)
+    
+    def __getitem__(self, index: int) -> torch.Tensor:
+        image = Image.open(self.image_paths[index])
+        # JPEG only: let libjpeg decode at a reduced DCT scale that still covers
+        # the 224px resize instead of decoding the full-resolution photo
+        image.draft("RGB", (DRAFT_SIZE, DRAFT_SIZE))
+        
+        # Size comes from the header (reduced by draft for JPEG); refuse to
+        # decode anything that would still be huge in memory
+        width, height = image.size
+        if width * height > MAX_DECODE_PIXELS:
+            image.close()
+            raise ValueError(
+                f"Image too large to score: {width}x{height} "
+                f"({self.image_paths[index]})"
+            )
+        return self.preprocess(image.convert("RGB"))
+
 
 class CLIPAestheticScorer:
     """
@@ -105,9 +146,37 @@ class CLIPAestheticScorer:
         "category": 0.15     # 15% - Category-specific appeal
     }
     
+    # Raw similarity -> aesthetic score mapping (np.interp knots)
+    # More aggressive mapping to utilize full 0-100 range
+    # Based on observation: most photos score 0.20-0.28 in CLIP
+    #   0.16 worst case (blurry) -> 40, 0.23 average snapshot -> 65,
+    #   0.26 good photo -> 80, 0.30 professional photo -> 95
+    # Outer knots at the cosine bounds (-1, 1) extend the end segments' slopes,
+    # so out-of-range values extrapolate before the final clamp as before
+    _SIM_X = np.array([-1.0, 0.16, 0.23, 0.26, 0.30, 1.0])
+    _SCORE_Y = np.array([
+        40 - (0.16 + 1.0) * 25 / 0.07,
+        40.0, 65.0, 80.0, 95.0,
+        95 + (1.0 - 0.30) * 15 / 0.04
+    ])
+    
+    # Tier boundaries (average / good photo similarity) for the breakdown
+    _TIER_BOUNDS = np.array([0.23, 0.26])
+    _TIERS = ("poor", "good", "excellent")
+    
     # Quality threshold for detailed evaluation
     QUICK_THRESHOLD = 0.20  # If quick score < 20%, skip detailed analysis
     
+    # Images per encode_image call; throughput gains flatten out past ~16
+    MAX_BATCH_SIZE = 16
+    
+    # DataLoader workers decoding/preprocessing ahead of the model
+    LOADER_WORKERS = 4
+    LOADER_PREFETCH = 4
+    
+    # Cached image embeddings (~1-2KB each) for re-scoring the same photo
+    EMBEDDING_CACHE_SIZE = 256
+    
     def __init__(self, device: str = None):
         """
         Initialize CLIP model for aesthetic scoring.
@@ -128,11 +197,34 @@ class CLIPAestheticScorer:
         self.device = device
         logger.info(f"Initializing CLIP model on device: {device}")
         
+        # Image embeddings by content hash; scoring runs on several threads
+        self._embedding_cache = LRUCache(maxsize=self.EMBEDDING_CACHE_SIZE)
+        self._embedding_cache_lock = threading.Lock()
+        
         try:
             # Load CLIP model - ViT-B/32 balances performance and accuracy
             self.model, self.preprocess = clip.load("ViT-B/32", device=device)
             self.model.eval()  # Set to evaluation mode
             
+            # FP16 on GPUs (clip.load only upcasts on CPU; made explicit here)
+            if device in ("cuda", "mps"):
+                self.model = self.model.half()
+            
+            # CUDA only: compile the vision tower with CUDA-graph replay. Graphs
+            # are shape-specific, so batches are padded to MAX_BATCH_SIZE.
+            # CUDA-graph trees are thread-local, so capture and every replay run
+            # on one dedicated inference thread owned by the scorer
+            self.compiled_visual = device == "cuda"
+            self._inference_executor = None
+            if self.compiled_visual:
+                self._inference_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="clip-inference"
+                )
+                self.model.visual = torch.compile(
+                    self.model.visual, mode="reduce-overhead", fullgraph=True
+                )
+                self._warmup_visual()
+            
             # Pre-encode text prompts to avoid redundant computation
             self._encode_all_prompts()
             
@@ -142,97 +234,292 @@ class CLIPAestheticScorer:
             logger.error(f"Failed to load CLIP model: {e}")
             raise
     
+    def _warmup_visual(self):
+        """Trigger compilation and graph capture with a dummy fixed-size batch"""
+        logger.info("Compiling CLIP image encoder...")
+        dummy = torch.zeros(self.MAX_BATCH_SIZE, 3, 224, 224, device=self.device)
+        self._encode_images(dummy)
+    
     def _encode_all_prompts(self):
         """
-        Pre-encode all text prompts into embeddings.
+        Pre-encode all text prompts into one normalized embedding matrix.
         This optimization reduces inference time by 60% since prompts are reused.
+        
+        Rows are L2-normalized once here and stored contiguously in the model's
+        dtype (fp16 on GPU), so scoring never re-normalizes text embeddings.
+        prompt_slices / category_slices map each prompt group to its rows.
         """
         logger.info("Pre-encoding text prompts...")
         
-        with torch.no_grad():
-            # Quick filter prompts
-            self.quick_embeddings = self._encode_text_batch(self.QUICK_PROMPTS)
-            
-            # Detailed prompts by dimension
-            self.detailed_embeddings = {}
-            for dimension, prompts in self.DETAILED_PROMPTS.items():
-                self.detailed_embeddings[dimension] = self._encode_text_batch(prompts)
-            
-            # Category-specific prompts
-            self.category_embeddings = {}
-            for category, prompts in self.CATEGORY_PROMPTS.items():
-                self.category_embeddings[category] = self._encode_text_batch(prompts)
-            
-            # Negative prompts
-            self.negative_embeddings = self._encode_text_batch(self.NEGATIVE_PROMPTS)
+        self.prompt_slices = _PROMPT_SLICES
+        self.category_slices = _CATEGORY_SLICES
+        self.category_index = {category: i for i, category in enumerate(self.category_slices)}
+        
+        # WEIGHTS as a vector over [prompt-group columns..., per-image category score]
+        weighted_groups = [name for name in self.WEIGHTS if name in self.prompt_slices]
+        self._weighted_columns = [list(self.prompt_slices).index(name) for name in weighted_groups]
+        self._weight_vec = torch.tensor(
+            [self.WEIGHTS[name] for name in weighted_groups] + [self.WEIGHTS["category"]],
+            device=self.device
+        )
+        
+        with torch.inference_mode():
+            text_embeddings = self._encode_text_batch(_PROMPT_TOKENS)
+            text_embeddings = text_embeddings / text_embeddings.norm(dim=-1, keepdim=True)
+            self.all_text_emb = text_embeddings.to(self.model.dtype).contiguous()
         
         logger.info("Text prompts encoded successfully")
     
-    def _encode_text_batch(self, prompts: List[str]) -> torch.Tensor:
-        """Encode a batch of text prompts"""
-        text_tokens = clip.tokenize(prompts).to(self.device)
-        return self.model.encode_text(text_tokens)
+    @torch.inference_mode()
+    def _encode_text_batch(self, text_tokens: torch.Tensor) -> torch.Tensor:
+        """Encode a batch of tokenized text prompts"""
+        text_tokens = text_tokens.to(self.device)
+        with self._autocast():
+            return self.model.encode_text(text_tokens)
+    
+    def _autocast(self):
+        """
+        FP16 autocast context on CUDA; a no-op elsewhere.
+
+        torch 2.1 has no MPS autocast (it raises on device_type='mps'), so on
+        Apple Silicon the .half() weights and inputs cast to model.dtype carry fp16.
+        """
+        if self.device == "cuda":
+            return torch.autocast(device_type="cuda", dtype=torch.float16)
+        return nullcontext()
     
-    def _encode_image(self, image_path: str) -> torch.Tensor:
+    def _image_loader(self, image_paths: List[str]) -> DataLoader:
         """
-        Encode image into CLIP embedding.
+        Build a DataLoader that decodes and preprocesses images off the main thread.
+        
+        Worker processes prepare batch N+1 while the model encodes batch N.
+        A single batch has nothing to overlap with, so it is loaded in-process
+        to avoid worker start-up cost (the common one-upload case).
         
         Args:
-            image_path: Path to image file
+            image_paths: Paths to image files
             
         Returns:
-            Image embedding tensor
+            DataLoader yielding (B, 3, 224, 224) tensors of at most MAX_BATCH_SIZE
         """
-        try:
-            image = Image.open(image_path).convert("RGB")
-            image_input = self.preprocess(image).unsqueeze(0).to(self.device)
-            
-            with torch.no_grad():
-                image_embedding = self.model.encode_image(image_input)
-            
-            return image_embedding
-            
-        except Exception as e:
-            logger.error(f"Failed to encode image {image_path}: {e}")
-            raise
+        num_workers = 0
+        if len(image_paths) > self.MAX_BATCH_SIZE:
+            num_workers = min(self.LOADER_WORKERS, os.cpu_count() or 1)
+        # The default collate builds each batch with one torch.stack over the
+        # sample list (into shared memory when workers are used); batches are
+        # never grown incrementally with torch.cat
+        return DataLoader(
+            _ImagePathDataset(image_paths, self.preprocess),
+            batch_size=self.MAX_BATCH_SIZE,
+            num_workers=num_workers,
+            prefetch_factor=self.LOADER_PREFETCH if num_workers else None,
+            pin_memory=(self.device == "cuda")
+        )
     
-    def _calculate_similarity(
-        self,
-        image_embedding: torch.Tensor,
-        text_embeddings: torch.Tensor
-    ) -> float:
+    def _encode_images(self, image_input: torch.Tensor) -> torch.Tensor:
         """
-        Calculate cosine similarity between image and text embeddings.
+        Encode a batch of preprocessed images into CLIP embeddings with one forward pass.
+        
+        With the compiled vision tower the forward pass is handed to the scorer's
+        single inference thread, where the warmup recorded the CUDA graphs; callers
+        on other threadpool workers would otherwise each record their own.
         
         Args:
-            image_embedding: Image CLIP embedding
-            text_embeddings: Text CLIP embeddings (can be multiple)
+            image_input: Preprocessed image tensor (B, 3, 224, 224)
             
         Returns:
-            Average similarity score (0-1)
+            Image embedding tensor of shape (B, D)
         """
-        # Normalize embeddings
-        image_embedding = image_embedding / image_embedding.norm(dim=-1, keepdim=True)
-        text_embeddings = text_embeddings / text_embeddings.norm(dim=-1, keepdim=True)
+        if self._inference_executor is not None:
+            return self._inference_executor.submit(self._forward_images, image_input).result()
+        return self._forward_images(image_input)
+    
+    @torch.inference_mode()
+    def _forward_images(self, image_input: torch.Tensor) -> torch.Tensor:
+        """Run the vision tower on one batch (see _encode_images)"""
+        # Batches arrive in pinned memory on CUDA (DataLoader pin_memory), so the
+        # copy is asynchronous; the fp16 cast happens after it, on the device,
+        # because casting on the host would produce a new pageable tensor
+        image_input = image_input.to(self.device, non_blocking=True).to(self.model.dtype)
+        
+        batch_size = image_input.shape[0]
+        if self.compiled_visual and batch_size < self.MAX_BATCH_SIZE:
+            # Pad the partial batch so the captured graph is replayed, not recompiled
+            padding = image_input.new_zeros((self.MAX_BATCH_SIZE - batch_size, *image_input.shape[1:]))
+            image_input = torch.cat([image_input, padding])
         
-        # Calculate cosine similarity
-        similarity = (image_embedding @ text_embeddings.T).squeeze(0)
+        with self._autocast():
+            image_embeddings = self.model.encode_image(image_input)
         
-        # Return average if multiple prompts
-        return similarity.mean().item()
+        if self.compiled_visual:
+            # CUDA-graph outputs are overwritten by the next replay
+            image_embeddings = image_embeddings[:batch_size].clone()
+        return image_embeddings
+    
+    @torch.inference_mode()
+    def _calculate_similarity(self, image_embeddings: torch.Tensor) -> torch.Tensor:
+        """
+        Calculate cosine similarity against every prompt with a single GEMM.
+        
+        Args:
+            image_embeddings: Image CLIP embeddings (B, D)
+            
+        Returns:
+            Similarity matrix of shape (B, N) over the rows of all_text_emb
+        """
+        # Text rows are normalized at init; only the images need it here
+        image_embeddings = image_embeddings / image_embeddings.norm(dim=-1, keepdim=True)
+        with self._autocast():
+            similarities = image_embeddings @ self.all_text_emb.T
+        
+        # Back to float32 for the group means and Python-side score mapping
+        return similarities.float()
+    
+    @staticmethod
+    def _group_means(similarities: torch.Tensor, slices: Dict[str, slice]) -> torch.Tensor:
+        """Average (B, N) similarities over each group's rows -> (B, len(slices))"""
+        return torch.stack(
+            [similarities[:, rows].mean(dim=-1) for rows in slices.values()],
+            dim=-1
+        )
     
     def evaluate_image(self, image_path: str, category: str = "other") -> Dict[str, float]:
         """Evaluate image aesthetic quality with detailed breakdown."""
-        logger.info(f"Evaluating image: {image_path}, category: {category}")
+        return self.evaluate_images_batch([image_path], [category])[0]
+    
+    @staticmethod
+    def _content_key(image_path: str) -> str:
+        """Hash the file contents so re-scoring the same photo can reuse its embedding"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(image_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _get_image_embeddings(self, image_paths: List[str]) -> List[torch.Tensor]:
+        """
+        Get one embedding per path, encoding only images not already in the LRU cache.
         
-        image_embedding = self._encode_image(image_path)
+        Args:
+            image_paths: Paths to image files
+            
+        Returns:
+            Image embeddings (D,) in input order
+        """
+        keys = [self._content_key(path) for path in image_paths]
         
-        # Stage 1: Quick quality filter
-        quick_score = self._calculate_similarity(
-            image_embedding,
-            self.quick_embeddings
-        )
+        embeddings = {}
+        with self._embedding_cache_lock:
+            for key in keys:
+                cached = self._embedding_cache.get(key)
+                if cached is not None:
+                    embeddings[key] = cached
+        
+        # Unique misses only: the same photo twice in one call is encoded once
+        missing = {}
+        for key, path in zip(keys, image_paths):
+            if key not in embeddings:
+                missing.setdefault(key, path)
+        
+        missing_keys = list(missing)
+        missing_paths = list(missing.values())
+        batches = zip(range(0, len(missing_paths), self.MAX_BATCH_SIZE), self._image_loader(missing_paths))
+        for start, image_input in batches:
+            batch_keys = missing_keys[start:start + self.MAX_BATCH_SIZE]
+            logger.info(f"Encoding batch of {len(batch_keys)} image(s)")
+            
+            try:
+                image_embeddings = self._encode_images(image_input)
+            except Exception as e:
+                logger.error(f"Failed to encode images {missing_paths[start:start + self.MAX_BATCH_SIZE]}: {e}")
+                raise
+            
+            with self._embedding_cache_lock:
+                for key, embedding in zip(batch_keys, image_embeddings):
+                    embeddings[key] = embedding
+                    self._embedding_cache[key] = embedding
+        
+        if len(missing) < len(keys):
+            logger.info(f"Image embedding cache: {len(keys) - len(missing)} of {len(keys)} reused")
         
+        return [embeddings[key] for key in keys]
+    
+    @torch.inference_mode()
+    def evaluate_images_batch(
+        self,
+        image_paths: List[str],
+        categories: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        Evaluate several images, encoding them in batches of MAX_BATCH_SIZE.
+        Runs entirely under inference_mode so no autograd state is kept between calls.
+        
+        Args:
+            image_paths: Paths to image files
+            categories: Photo category per image (defaults to "other")
+            
+        Returns:
+            One result dict per image, in input order (same shape as evaluate_image)
+        """
+        if categories is None:
+            categories = ["other"] * len(image_paths)
+        
+        embeddings = self._get_image_embeddings(image_paths)
+        
+        results = []
+        for start in range(0, len(image_paths), self.MAX_BATCH_SIZE):
+            batch_paths = image_paths[start:start + self.MAX_BATCH_SIZE]
+            batch_categories = categories[start:start + self.MAX_BATCH_SIZE]
+            image_embeddings = torch.stack(embeddings[start:start + self.MAX_BATCH_SIZE])
+            
+            # One GEMM per batch covers every prompt group and category
+            similarities = self._calculate_similarity(image_embeddings)
+            group_scores = self._group_means(similarities, self.prompt_slices)
+            category_keys = [
+                category.lower() if category.lower() in self.CATEGORY_PROMPTS else "other"
+                for category in batch_categories
+            ]
+            category_ids = torch.tensor(
+                [self.category_index[key] for key in category_keys], device=similarities.device
+            )
+            category_scores = self._group_means(similarities, self.category_slices).gather(
+                1, category_ids[:, None]
+            )
+            
+            # Weighted sum for the whole batch: (B, 5) @ (5,) on-device
+            weighted_scores = torch.cat(
+                [group_scores[:, self._weighted_columns], category_scores], dim=1
+            ) @ self._weight_vec
+            
+            group_rows = group_scores.tolist()
+            category_list = category_scores.squeeze(1).tolist()
+            weighted_list = weighted_scores.tolist()
+            for i, (image_path, category) in enumerate(zip(batch_paths, batch_categories)):
+                logger.info(f"Evaluating image: {image_path}, category: {category}")
+                scores = dict(zip(self.prompt_slices, group_rows[i]))
+                results.append(self._score_from_similarities(
+                    scores["universal"],
+                    scores["technical"],
+                    scores["composition"],
+                    scores["lighting"],
+                    category_list[i],
+                    scores["negative"],
+                    weighted_list[i]
+                ))
+        
+        return results
+    
+    def _score_from_similarities(
+        self,
+        quick_score: float,
+        technical_score: float,
+        composition_score: float,
+        lighting_score: float,
+        category_score: float,
+        negative_score: float,
+        weighted_raw_score: float
+    ) -> Dict:
+        """Map one image's raw CLIP similarities (and their WEIGHTS sum) to the final aesthetic score."""
         logger.info(f"Quick filter raw score: {quick_score:.3f}")
         
         # Lower threshold for initial filter
@@ -255,72 +542,16 @@ class CLIPAestheticScorer:
         # Stage 2: Detailed evaluation
         breakdown = {}
         breakdown["universal_raw"] = quick_score
-        
-        technical_score = self._calculate_similarity(
-            image_embedding,
-            self.detailed_embeddings["technical"]
-        )
         breakdown["technical_raw"] = technical_score
-        
-        composition_score = self._calculate_similarity(
-            image_embedding,
-            self.detailed_embeddings["composition"]
-        )
         breakdown["composition_raw"] = composition_score
-        
-        lighting_score = self._calculate_similarity(
-            image_embedding,
-            self.detailed_embeddings["lighting"]
-        )
         breakdown["lighting_raw"] = lighting_score
-        
-        category_key = category.lower() if category.lower() in self.CATEGORY_PROMPTS else "other"
-        category_score = self._calculate_similarity(
-            image_embedding,
-            self.category_embeddings[category_key]
-        )
         breakdown["category_raw"] = category_score
-        
-        negative_score = self._calculate_similarity(
-            image_embedding,
-            self.negative_embeddings
-        )
         breakdown["negative_raw"] = negative_score
         
-        # Calculate weighted score from raw similarities
-        weighted_raw_score = (
-            quick_score * self.WEIGHTS["universal"] +
-            technical_score * self.WEIGHTS["technical"] +
-            composition_score * self.WEIGHTS["composition"] +
-            lighting_score * self.WEIGHTS["lighting"] +
-            category_score * self.WEIGHTS["category"]
-        )
-        
         logger.info(f"Weighted raw score: {weighted_raw_score:.3f}")
 
-        # More aggressive mapping to utilize full 0-100 range
-        # Based on observation: most photos score 0.20-0.28 in CLIP
-        # We need to map this narrow range to 40-90
-
-        # Define very tight CLIP similarity ranges based on actual data
-        min_sim = 0.16  # Worst case (blurry, poor quality)
-        avg_sim = 0.23  # Average snapshot
-        good_sim = 0.26 # Good photo
-        excellent_sim = 0.30  # Professional photo
-
-        # Apply progressive mapping for better distribution
-        if weighted_raw_score < avg_sim:
-            # Map [0.16, 0.23] to [40, 65]
-            # Even poor photos get reasonable scores
-            aesthetic_score = ((weighted_raw_score - min_sim) / (avg_sim - min_sim)) * 25 + 40
-        elif weighted_raw_score < good_sim:
-            # Map [0.23, 0.26] to [65, 80]
-            # Good photos get good scores
-            aesthetic_score = ((weighted_raw_score - avg_sim) / (good_sim - avg_sim)) * 15 + 65
-        else:
-            # Map [0.26, 0.30] to [80, 95]
-            # Excellent photos get excellent scores
-            aesthetic_score = ((weighted_raw_score - good_sim) / (excellent_sim - good_sim)) * 15 + 80
+        # Piecewise-linear mapping of the narrow CLIP range onto the score scale
+        aesthetic_score = float(np.interp(weighted_raw_score, self._SIM_X, self._SCORE_Y))
 
         # Minimal contrastive penalty (only for obviously bad photos)
         if negative_score > 0.22:
@@ -336,11 +567,9 @@ class CLIPAestheticScorer:
         breakdown["aesthetic_score"] = aesthetic_score
         breakdown["weighted_raw"] = weighted_raw_score
         breakdown["negative_penalty"] = negative_penalty
-        breakdown["mapping_tier"] = (
-            "poor" if weighted_raw_score < avg_sim else
-            "good" if weighted_raw_score < good_sim else
-            "excellent"
-        )
+        breakdown["mapping_tier"] = self._TIERS[
+            int(np.searchsorted(self._TIER_BOUNDS, weighted_raw_score, side="right"))
+        ]
 
         logger.info(f"Final aesthetic score: {aesthetic_score:.2f} (tier: {breakdown['mapping_tier']})")
 
@@ -351,14 +580,47 @@ class CLIPAestheticScorer:
         }
 
 
+def _flatten_prompts(scorer_cls) -> Tuple[List[str], Dict[str, slice], Dict[str, slice]]:
+    """
+    Flatten the scorer's prompt groups into one list in a fixed order.
+    
+    Returns:
+        Tuple of (prompts, scoring-group row slices, category row slices)
+    """
+    groups = {"universal": scorer_cls.QUICK_PROMPTS}
+    groups.update(scorer_cls.DETAILED_PROMPTS)
+    groups["negative"] = scorer_cls.NEGATIVE_PROMPTS
+    
+    prompts = []
+    prompt_slices = {}
+    for name, group in groups.items():
+        prompt_slices[name] = slice(len(prompts), len(prompts) + len(group))
+        prompts.extend(group)
+    
+    category_slices = {}
+    for category, group in scorer_cls.CATEGORY_PROMPTS.items():
+        category_slices[category] = slice(len(prompts), len(prompts) + len(group))
+        prompts.extend(group)
+    
+    return prompts, prompt_slices, category_slices
+
+
+# Prompts are fixed at class definition, so tokenize them once at import
+_ALL_PROMPTS, _PROMPT_SLICES, _CATEGORY_SLICES = _flatten_prompts(CLIPAestheticScorer)
+_PROMPT_TOKENS = clip.tokenize(_ALL_PROMPTS)
+
+
 # Global scorer instance (lazy initialization)
 _scorer_instance = None
+_scorer_lock = threading.Lock()
 
 
 def get_aesthetic_scorer() -> CLIPAestheticScorer:
     """
     Get or create the global aesthetic scorer instance.
     Uses singleton pattern to avoid reloading CLIP model on each request.
+    Double-checked locking ensures concurrent first calls from threadpool
+    workers build the model only once.
     
     Returns:
         Initialized CLIPAestheticScorer instance
@@ -366,8 +628,10 @@ def get_aesthetic_scorer() -> CLIPAestheticScorer:
     global _scorer_instance
     
     if _scorer_instance is None:
-        logger.info("Initializing CLIP aesthetic scorer (first time)...")
-        _scorer_instance = CLIPAestheticScorer()
+        with _scorer_lock:
+            if _scorer_instance is None:
+                logger.info("Initializing CLIP aesthetic scorer (first time)...")
+                _scorer_instance = CLIPAestheticScorer()
     
     return _scorer_instance
 
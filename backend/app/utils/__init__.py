@@ -0,0 +1,13 @@
+from app.utils.cache import spot_cache, invalidate_spot
+from app.utils.images import create_thumbnail, extract_embedded_thumbnail
+
+# ImmutableStaticFiles is deliberately not re-exported: importing it pulls in
+# Starlette, and thumbnail pool workers import this package to unpickle
+# create_thumbnail. Import it from app.utils.static_files instead.
+
+__all__ = [
+    "spot_cache",
+    "invalidate_spot",
+    "create_thumbnail",
+    "extract_embedded_thumbnail"
+]
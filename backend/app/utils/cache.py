@@ -0,0 +1,20 @@
+"""
+In-process caches for read-heavy API endpoints.
+Entries are short-lived and invalidated explicitly when the underlying row changes.
+"""
+
+from cachetools import TTLCache
+
+# Serialized PhotoSpotResponse objects keyed by spot ID
+# Short TTL bounds staleness across worker processes, which do not share this cache
+spot_cache = TTLCache(maxsize=1024, ttl=30)
+
+
+def invalidate_spot(spot_id: int):
+    """
+    Drop a cached photo spot after it has been updated or deleted.
+
+    Args:
+        spot_id: ID of the photo spot to evict
+    """
+    spot_cache.pop(spot_id, None)
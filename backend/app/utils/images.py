@@ -0,0 +1,102 @@
+"""
+Image processing helpers for uploaded photos.
+Kept free of heavy imports so functions can run in worker processes
+(e.g. the thumbnail ProcessPoolExecutor) without loading the API stack.
+"""
+
+from PIL import Image, ExifTags
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+import io
+import logging
+import multiprocessing
+import os
+
+logger = logging.getLogger(__name__)
+
+# Thumbnails are short jobs; a few workers keep up without one process per core
+THUMBNAIL_WORKERS = min(4, os.cpu_count() or 1)
+
+# Embedded EXIF thumbnails whose aspect ratio differs from the photo's by more
+# than this (relative) are stale, cropped or letterboxed and are regenerated
+EMBEDDED_THUMBNAIL_ASPECT_TOLERANCE = 0.02
+
+
+def extract_embedded_thumbnail(img: Image.Image, min_size: int) -> Optional[bytes]:
+    """
+    Return the JPEG thumbnail embedded in EXIF IFD1 if it can stand in for a
+    generated one: shortest side at least min_size and the same aspect ratio as img.
+    Reading it is a byte copy, no decode or resample of the full image.
+    """
+    raw_exif = img.info.get("exif")
+    if not raw_exif or not raw_exif.startswith(b"Exif\x00\x00"):
+        return None
+    
+    try:
+        ifd1 = img.getexif().get_ifd(ExifTags.IFD.IFD1)
+        offset = ifd1.get(0x0201)  # JPEGInterchangeFormat
+        length = ifd1.get(0x0202)  # JPEGInterchangeFormatLength
+        if not offset or not length:
+            return None
+        
+        # Offsets are relative to the TIFF header that follows the "Exif\0\0" marker
+        start = 6 + offset
+        thumb_bytes = raw_exif[start:start + length]
+        
+        # Only the header is parsed here to check dimensions
+        with Image.open(io.BytesIO(thumb_bytes)) as thumb:
+            thumb_width, thumb_height = thumb.size
+        if min(thumb_width, thumb_height) < min_size:
+            return None
+        
+        width, height = img.size
+        image_ratio = width / height
+        if abs(thumb_width / thumb_height - image_ratio) > EMBEDDED_THUMBNAIL_ASPECT_TOLERANCE * image_ratio:
+            return None
+        return thumb_bytes
+    except Exception:
+        return None
+
+
+def create_thumbnail_executor() -> ProcessPoolExecutor:
+    """
+    Create the process pool used for create_thumbnail.
+    Workers are spawned rather than forked: the API process has threads running
+    and may have CLIP/CUDA loaded, neither of which is safe to fork.
+    """
+    return ProcessPoolExecutor(
+        max_workers=THUMBNAIL_WORKERS,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def create_thumbnail(source_path: str, thumbnail_path: str, size: tuple = (300, 300)):
+    """
+    Create a thumbnail from the source image.
+    Uses the EXIF-embedded thumbnail when available, otherwise maintains
+    aspect ratio and uses high-quality resampling.
+    """
+    try:
+        with Image.open(source_path) as img:
+            embedded = extract_embedded_thumbnail(img, min(size))
+            if embedded:
+                with open(thumbnail_path, "wb") as f:
+                    f.write(embedded)
+                logger.debug("Thumbnail extracted from EXIF: %s (%d bytes)", thumbnail_path, len(embedded))
+                return True
+            
+            # Convert RGBA to RGB if necessary
+            if img.mode == 'RGBA':
+                img = img.convert('RGB')
+            
+            # Create thumbnail maintaining aspect ratio
+            img.thumbnail(size, Image.Resampling.LANCZOS)
+            
+            # Save thumbnail with good quality
+            img.save(thumbnail_path, 'JPEG', quality=85, optimize=True)
+            
+            logger.debug("Thumbnail created: %s (%dx%d)", thumbnail_path, img.size[0], img.size[1])
+            return True
+    except Exception as e:
+        logger.error("Error creating thumbnail: %s", e)
+        return False
@@ -0,0 +1,32 @@
+"""
+Static file serving for uploaded media.
+Uploaded photos and thumbnails use UUID filenames and are never rewritten,
+so responses can be cached by clients and proxies indefinitely.
+"""
+
+import os
+from typing import Any, MutableMapping, Union
+
+from fastapi.staticfiles import StaticFiles
+from starlette.responses import Response
+
+# One year, the conventional maximum for immutable assets
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """
+    StaticFiles that marks every served file as immutable.
+    Lets clients skip revalidation requests for images they already have.
+    """
+
+    def file_response(
+        self,
+        full_path: Union[str, "os.PathLike[str]"],
+        stat_result: os.stat_result,
+        scope: MutableMapping[str, Any],
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
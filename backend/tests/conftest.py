@@ -0,0 +1,93 @@
+"""
+Shared fixtures for backend tests.
+API tests run against the FastAPI app with the database session dependency
+overridden by an in-memory fake, so no PostgreSQL instance is needed.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Make the `app` package importable when pytest is run from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import get_db
+from app.main import app
+from app.models.photo_spot import PhotoSpot
+from app.utils.cache import spot_cache
+
+CREATED_AT = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_spot(spot_id: int, **fields) -> PhotoSpot:
+    """PhotoSpot row as the database would return it (server-side values filled in)"""
+    values = {
+        "name": f"Spot {spot_id}",
+        "latitude": 37.77,
+        "longitude": -122.42,
+        "category": "landscape",
+        "aesthetic_score": 70.0,
+        "popularity_score": 50.0,
+        "difficulty_level": "moderate",
+        "tags": [],
+        "is_active": True,
+        "created_at": CREATED_AT,
+        "updated_at": None,
+    }
+    values.update(fields)
+    values["overall_score"] = values["aesthetic_score"] * 0.6 + values["popularity_score"] * 0.4
+    return PhotoSpot(id=spot_id, **values)
+
+
+class FakeScalarResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return list(self.rows)
+
+
+class FakeSession:
+    """Minimal AsyncSession stand-in recording the statements it receives"""
+
+    def __init__(self):
+        self.spots = {}
+        self.statements = []
+        self.get_calls = []
+        self.commits = 0
+
+    async def get(self, model, spot_id):
+        self.get_calls.append(spot_id)
+        return self.spots.get(spot_id)
+
+    async def scalars(self, statement, params=None):
+        # Bulk INSERT ... RETURNING: rows come back in parameter order, as
+        # PostgreSQL guarantees with sort_by_parameter_order=True
+        self.statements.append(statement)
+        return FakeScalarResult(
+            make_spot(i, **row) for i, row in enumerate(params or [], start=1)
+        )
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def db():
+    return FakeSession()
+
+
+@pytest.fixture
+def client(db):
+    async def override_get_db():
+        yield db
+
+    spot_cache.clear()
+    app.dependency_overrides[get_db] = override_get_db
+    # Not used as a context manager: the lifespan (database, CLIP preload) is skipped
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    spot_cache.clear()
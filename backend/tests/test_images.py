@@ -0,0 +1,92 @@
+"""
+Tests for thumbnail generation and EXIF-embedded thumbnail reuse.
+"""
+
+import io
+import struct
+
+import pytest
+from PIL import Image
+
+from app.utils.images import create_thumbnail, extract_embedded_thumbnail
+
+
+def jpeg_bytes(size, color=(90, 120, 200), **save_args) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "JPEG", **save_args)
+    return buffer.getvalue()
+
+
+def exif_with_thumbnail(thumbnail: bytes) -> bytes:
+    """
+    Raw EXIF block (little-endian TIFF) with an Orientation tag in IFD0 and
+    IFD1 pointing at the given JPEG thumbnail, which follows the IFDs.
+    """
+    tiff = b"II*\x00" + struct.pack("<I", 8)
+    # IFD0: one entry (Orientation = 1), next IFD at offset 26
+    tiff += struct.pack("<H", 1) + struct.pack("<HHIHH", 0x0112, 3, 1, 1, 0) + struct.pack("<I", 26)
+    # IFD1: JPEGInterchangeFormat (offset 56) and JPEGInterchangeFormatLength
+    tiff += struct.pack("<H", 2)
+    tiff += struct.pack("<HHII", 0x0201, 4, 1, 56) + struct.pack("<HHII", 0x0202, 4, 1, len(thumbnail))
+    tiff += struct.pack("<I", 0)
+    return b"Exif\x00\x00" + tiff + thumbnail
+
+
+@pytest.fixture
+def photo_with_thumbnail(tmp_path):
+    """Write a 1600x1200 JPEG embedding a JPEG thumbnail of the given size"""
+    def write(thumbnail_size):
+        thumbnail = jpeg_bytes(thumbnail_size, color=(200, 20, 20))
+        path = tmp_path / "photo.jpg"
+        path.write_bytes(jpeg_bytes((1600, 1200), exif=exif_with_thumbnail(thumbnail)))
+        return path, thumbnail
+    return write
+
+
+def test_reuses_large_matching_embedded_thumbnail(photo_with_thumbnail, tmp_path):
+    path, thumbnail = photo_with_thumbnail((400, 300))
+
+    with Image.open(path) as img:
+        assert extract_embedded_thumbnail(img, 300) == thumbnail
+
+    output = tmp_path / "thumb.jpg"
+    assert create_thumbnail(str(path), str(output))
+    assert output.read_bytes() == thumbnail
+
+
+@pytest.mark.parametrize("thumbnail_size", [
+    (160, 120),  # typical camera preview: smaller than the requested size
+    (400, 400),  # cropped/letterboxed: aspect ratio differs from the photo
+])
+def test_falls_back_to_resampling(photo_with_thumbnail, tmp_path, thumbnail_size):
+    path, thumbnail = photo_with_thumbnail(thumbnail_size)
+
+    with Image.open(path) as img:
+        assert extract_embedded_thumbnail(img, 300) is None
+
+    output = tmp_path / "thumb.jpg"
+    assert create_thumbnail(str(path), str(output))
+    assert output.read_bytes() != thumbnail
+    with Image.open(output) as generated:
+        assert generated.size == (300, 225)
+
+
+def test_photo_without_exif(tmp_path):
+    path = tmp_path / "plain.png"
+    Image.new("RGBA", (900, 600), (10, 20, 30, 255)).save(path)
+
+    with Image.open(path) as img:
+        assert extract_embedded_thumbnail(img, 300) is None
+
+    output = tmp_path / "thumb.jpg"
+    assert create_thumbnail(str(path), str(output))
+    with Image.open(output) as generated:
+        assert generated.format == "JPEG"
+        assert generated.size == (300, 200)
+
+
+def test_unreadable_source_returns_false(tmp_path):
+    path = tmp_path / "broken.jpg"
+    path.write_bytes(b"not an image")
+
+    assert create_thumbnail(str(path), str(tmp_path / "thumb.jpg")) is False
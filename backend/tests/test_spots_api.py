@@ -0,0 +1,137 @@
+"""
+Tests for the PhotoSpot API: bulk creation and ETag revalidation.
+"""
+
+from datetime import datetime
+
+from app.utils.cache import spot_cache
+from conftest import make_spot
+
+
+def spot_payload(name: str, **fields) -> dict:
+    payload = {"name": name, "latitude": 48.85, "longitude": 2.35, "category": "architecture"}
+    payload.update(fields)
+    return payload
+
+
+class TestBulkCreate:
+    def test_returns_spots_in_request_order(self, client, db):
+        names = ["Pont Neuf", "Louvre", "Sacre-Coeur"]
+        response = client.post("/api/spots/bulk", json=[spot_payload(name) for name in names])
+
+        assert response.status_code == 201
+        assert [spot["name"] for spot in response.json()] == names
+        assert db.commits == 1
+
+        # RETURNING rows must be matched back to the input rows by position
+        (statement,) = db.statements
+        assert statement._sort_by_parameter_order
+
+    def test_normalizes_fields_before_insert(self, client):
+        response = client.post(
+            "/api/spots/bulk",
+            json=[spot_payload("Louvre", category="Architecture", difficulty_level="EASY", tags=["paris"])]
+        )
+
+        assert response.status_code == 201
+        (spot,) = response.json()
+        assert spot["category"] == "architecture"
+        assert spot["difficulty_level"] == "easy"
+        assert spot["tags"] == ["paris"]
+
+    def test_empty_list_creates_nothing(self, client, db):
+        response = client.post("/api/spots/bulk", json=[])
+
+        assert response.status_code == 201
+        assert response.json() == []
+        assert db.statements == []
+        assert db.commits == 0
+
+    def test_invalid_json_is_422(self, client, db):
+        response = client.post(
+            "/api/spots/bulk", content=b"[{", headers={"Content-Type": "application/json"}
+        )
+
+        assert response.status_code == 422
+        (error,) = response.json()["detail"]
+        assert error["type"] == "json_invalid"
+        assert error["loc"][0] == "body"
+        assert db.statements == []
+
+    def test_field_errors_have_body_locations(self, client, db):
+        response = client.post(
+            "/api/spots/bulk",
+            json=[spot_payload("Louvre"), spot_payload("Nowhere", category="selfie", latitude=91)]
+        )
+
+        assert response.status_code == 422
+        errors = {tuple(error["loc"]): error["type"] for error in response.json()["detail"]}
+        assert errors == {
+            ("body", 1, "latitude"): "less_than_equal",
+            ("body", 1, "category"): "literal_error",
+        }
+        assert db.statements == []
+
+    def test_non_list_body_is_422(self, client):
+        response = client.post("/api/spots/bulk", json=spot_payload("Louvre"))
+
+        assert response.status_code == 422
+        (error,) = response.json()["detail"]
+        assert error["loc"] == ["body"]
+        assert error["type"] == "list_type"
+
+
+class TestGetSpotETag:
+    def test_returns_weak_etag_and_caches_response(self, client, db):
+        db.spots[1] = make_spot(1)
+
+        first = client.get("/api/spots/1")
+        second = client.get("/api/spots/1")
+
+        assert first.status_code == second.status_code == 200
+        assert first.headers["etag"].startswith('W/"1-')
+        assert second.headers["etag"] == first.headers["etag"]
+        assert first.headers["cache-control"] == "private, max-age=10"
+        # Second request is served from the in-process cache
+        assert db.get_calls == [1]
+
+    def test_matching_if_none_match_is_304(self, client, db):
+        db.spots[1] = make_spot(1)
+        etag = client.get("/api/spots/1").headers["etag"]
+
+        response = client.get("/api/spots/1", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_weak_comparison_and_tag_lists(self, client, db):
+        db.spots[1] = make_spot(1)
+        etag = client.get("/api/spots/1").headers["etag"]
+        strong = etag.removeprefix("W/")
+
+        for header in (strong, f'"stale", {etag}', f'W/"stale",{strong}', "*"):
+            response = client.get("/api/spots/1", headers={"If-None-Match": header})
+            assert response.status_code == 304, header
+
+    def test_non_matching_if_none_match_is_200(self, client, db):
+        db.spots[1] = make_spot(1)
+
+        response = client.get("/api/spots/1", headers={"If-None-Match": 'W/"1-0"'})
+
+        assert response.status_code == 200
+        assert response.json()["id"] == 1
+
+    def test_etag_changes_after_update(self, client, db):
+        db.spots[1] = make_spot(1)
+        etag = client.get("/api/spots/1").headers["etag"]
+
+        spot_cache.clear()
+        db.spots[1] = make_spot(1, updated_at=datetime(2024, 6, 1))
+        response = client.get("/api/spots/1", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_missing_spot_is_404(self, client):
+        assert client.get("/api/spots/999").status_code == 404
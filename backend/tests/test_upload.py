@@ -0,0 +1,69 @@
+"""
+Tests for background aesthetic scoring after upload.
+"""
+
+import asyncio
+
+import pytest
+
+from app.api import upload
+from app.utils.cache import spot_cache
+
+
+class FakeScoringSession:
+    """Stand-in for SessionLocal() used by score_and_update"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.statements = []
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.statements.append(statement)
+
+    async def commit(self):
+        self.committed = True
+
+
+@pytest.fixture
+def scoring_session(monkeypatch):
+    session = FakeScoringSession()
+    monkeypatch.setattr(upload, "SessionLocal", lambda: session)
+    monkeypatch.setattr(upload, "calculate_aesthetic_score", lambda path, category: (88.5, {}))
+    spot_cache.clear()
+    yield session
+    spot_cache.clear()
+
+
+def test_score_and_update_stores_score_and_invalidates_cache(scoring_session):
+    spot_cache[1] = "stale response"
+    spot_cache[2] = "other spot"
+
+    asyncio.run(upload.score_and_update(1, "uploads/photos/a.jpg", "landscape"))
+
+    (statement,) = scoring_session.statements
+    params = statement.compile().params
+    assert params["aesthetic_score"] == 88.5
+    assert params["id_1"] == 1
+    assert scoring_session.committed
+    assert 1 not in spot_cache
+    assert 2 in spot_cache
+
+
+def test_score_and_update_keeps_cache_when_update_fails(scoring_session):
+    scoring_session.fail = True
+    spot_cache[1] = "cached response"
+
+    # Failures are logged, never raised out of the background task
+    asyncio.run(upload.score_and_update(1, "uploads/photos/a.jpg", "landscape"))
+
+    assert not scoring_session.committed
+    assert spot_cache[1] == "cached response"
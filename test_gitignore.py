@@ -6,98 +6,198 @@ Updated for full-stack project: Python backend + iOS frontend.
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Contents written to every test file (bytes: no text encoding per write)
+PAYLOAD = b"Test file - should be ignored by Git"
+
+# Paths (relative to the repository root) that .gitignore must exclude
+TEST_FILES = (
+    # === Python Backend Files ===
+    # Python cache
+    "backend/app/__pycache__/test.pyc",
+    "backend/app/__pycache__/main.cpython-311.pyc",
+    "backend/app/__pycache__/database.cpython-311.pyo",
+    
+    # Environment files
+    "backend/.env.test",
+    "backend/.env.local",
+    "backend/.env.development",
+    
+    # Database files
+    "backend/test.db",
+    "backend/test.sqlite",
+    "backend/test.sqlite3",
+    
+    # Log files
+    "backend/test.log",
+    "backend/app/debug.log",
+    "backend/error.log",
+    
+    # === iOS/Xcode Files ===
+    # Xcode user data (most common issue)
+    "ios/ShotSpotFinder/ShotSpotFinder.xcodeproj/xcuserdata/testuser.xcuserdatad/UserInterfaceState.xcuserstate",
+    "ios/ShotSpotFinder/ShotSpotFinder.xcodeproj/xcuserdata/testuser.xcuserdatad/xcschemes/xcschememanagement.plist",
+    "ios/ShotSpotFinder/ShotSpotFinder.xcodeproj/project.xcworkspace/xcuserdata/testuser.xcuserdatad/UserInterfaceState.xcuserstate",
+    
+    # Xcode build files
+    "ios/ShotSpotFinder/build/test.o",
+    "ios/ShotSpotFinder/DerivedData/test.log",
+    
+    # === IDE/Editor Files ===
+    ".vscode/settings.json",
+    ".idea/workspace.xml",
+    
+    # === OS Files ===
+    ".DS_Store",
+    "backend/.DS_Store",
+    "ios/.DS_Store",
+    
+    # === Temporary Files ===
+    "backend/temp.tmp",
+    "backend/backup.bak",
+    "test.swp",
+)
+
+
+def _ancestors(dir_path):
+    """dir_path and each of its parents, excluding the repository root"""
+    while dir_path:
+        yield dir_path
+        dir_path = os.path.dirname(dir_path)
+
+
+# Directories the test files live in (root-level files need none), and every
+# directory cleanup may have to remove, deepest first so children go before parents
+TEST_DIRS = tuple(sorted({os.path.dirname(p) for p in TEST_FILES} - {''}))
+CLEANUP_DIRS = tuple(sorted(
+    {a for d in TEST_DIRS for a in _ancestors(d)},
+    key=lambda d: (-d.count('/'), d)
+))
+
+# Path prefixes used to group results in the report
+BACKEND_PREFIX = 'backend/'
+IOS_PREFIX = 'ios/'
+
+# Upper bound on threads used for creating/removing test files
+MAX_IO_WORKERS = 32
+
+
+def _io_workers(paths):
+    """Thread count for per-file I/O over paths"""
+    return max(1, min(MAX_IO_WORKERS, len(paths)))
+
+
+def _write_lines(lines):
+    """Emit a block of report lines with a single write"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _write_test_file(file_path):
+    """Write one test file; returns the exception on failure, else None"""
+    try:
+        Path(file_path).write_bytes(PAYLOAD)
+    except Exception as e:
+        return e
+    return None
+
+
+def _remove_test_file(file_path):
+    """Remove one test file; returns True if removed, False if absent, or the exception"""
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        return e
+    return True
+
+
+def _repo_root():
+    """Top-level directory of the enclosing Git work tree, or None outside a repository"""
+    try:
+        output = subprocess.check_output(
+            ['git', 'rev-parse', '--show-toplevel'], stderr=subprocess.DEVNULL
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return Path(output.decode().strip())
+
 
 def create_test_files():
     """Create test files that should be ignored"""
     print("Creating test files that should be ignored by Git...\n")
 
-    test_files = [
-        # === Python Backend Files ===
-        # Python cache
-        "backend/app/__pycache__/test.pyc",
-        "backend/app/__pycache__/main.cpython-311.pyc",
-        "backend/app/__pycache__/database.cpython-311.pyo",
-        
-        # Environment files
-        "backend/.env.test",
-        "backend/.env.local",
-        "backend/.env.development",
-        
-        # Database files
-        "backend/test.db",
-        "backend/test.sqlite",
-        "backend/test.sqlite3",
-        
-        # Log files
-        "backend/test.log",
-        "backend/app/debug.log",
-        "backend/error.log",
-        
-        # === iOS/Xcode Files ===
-        # Xcode user data (most common issue)
-        "ios/ShotSpotFinder/ShotSpotFinder.xcodeproj/xcuserdata/testuser.xcuserdatad/UserInterfaceState.xcuserstate",
-        "ios/ShotSpotFinder/ShotSpotFinder.xcodeproj/xcuserdata/testuser.xcuserdatad/xcschemes/xcschememanagement.plist",
-        "ios/ShotSpotFinder/ShotSpotFinder.xcodeproj/project.xcworkspace/xcuserdata/testuser.xcuserdatad/UserInterfaceState.xcuserstate",
-        
-        # Xcode build files
-        "ios/ShotSpotFinder/build/test.o",
-        "ios/ShotSpotFinder/DerivedData/test.log",
-        
-        # === IDE/Editor Files ===
-        ".vscode/settings.json",
-        ".idea/workspace.xml",
-        
-        # === OS Files ===
-        ".DS_Store",
-        "backend/.DS_Store",
-        "ios/.DS_Store",
-        
-        # === Temporary Files ===
-        "backend/temp.tmp",
-        "backend/backup.bak",
-        "test.swp",
-    ]
-
     created_files = []
 
-    for file_path in test_files:
+    # Many test files share a parent; create each directory only once
+    for parent in TEST_DIRS:
         try:
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, 'w') as f:
-                f.write("Test file - should be ignored by Git")
-            created_files.append(file_path)
-            print(f"✅ Created: {file_path}")
+            os.makedirs(parent, exist_ok=True)
         except Exception as e:
-            print(f"❌ Failed to create {file_path}: {e}")
+            print(f"❌ Failed to create directory {parent}: {e}")
+
+    # Independent writes overlap on a thread pool; results come back in input order
+    with ThreadPoolExecutor(max_workers=_io_workers(TEST_FILES)) as executor:
+        errors = list(executor.map(_write_test_file, TEST_FILES))
+
+    lines = []
+    for file_path, error in zip(TEST_FILES, errors):
+        if error is None:
+            created_files.append(file_path)
+            lines.append(f"✅ Created: {file_path}")
+        else:
+            lines.append(f"❌ Failed to create {file_path}: {error}")
+    _write_lines(lines)
 
     return created_files
 
 
 def check_git_status(test_files):
-    """Check if test files are ignored by Git"""
+    """Check if test files are ignored by Git and report the rule that decided each one"""
     print("\n" + "=" * 70)
-    print("Checking Git status...")
+    print("Checking ignore status (git check-ignore)...")
     print("=" * 70 + "\n")
 
     try:
-        result = subprocess.run(
-            ['git', 'status', '--porcelain'],
-            capture_output=True,
-            text=True,
-            check=True
+        # One batched query. With --verbose git prints a record for every path that
+        # matched an exclude pattern: source, line number, pattern and path, each
+        # NUL-terminated under -z (so nothing is quoted or escaped). Negated
+        # "!pattern" matches are reported too and mean the path is NOT ignored.
+        # Exit status 0 = some matched, 1 = none matched, anything else = error
+        encoded_files = [f.encode() for f in test_files]
+        process = subprocess.Popen(
+            ['git', 'check-ignore', '--verbose', '--stdin', '-z'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
         )
-
-        tracked_files = result.stdout.strip().split('\n') if result.stdout.strip() else []
-
-        # Categorize files
+        stdout, stderr = process.communicate(b'\0'.join(encoded_files) + b'\0')
+        if process.returncode not in (0, 1):
+            raise subprocess.CalledProcessError(process.returncode, process.args, stdout, stderr)
+
+        # Paths stay bytes for lookup; only source and pattern are decoded for display
+        fields = iter(stdout.split(b'\0'))
+        matches = {
+            path: (source.decode(errors='replace'), line.decode(), pattern.decode(errors='replace'))
+            for source, line, pattern, path in zip(fields, fields, fields, fields)
+        }
+
+        # Categorize files (exact-path dict lookups, one pass), keeping the deciding rule
         ignored_correctly = []
         not_ignored = []
+        rules = {}
 
-        for test_file in test_files:
-            is_tracked = any(test_file in line for line in tracked_files)
-            if is_tracked:
+        for test_file, encoded in zip(test_files, encoded_files):
+            match = matches.get(encoded)
+            if match is None:
+                not_ignored.append(test_file)
+                continue
+            source, line, pattern = match
+            rules[test_file] = f"  ({source}:{line}: {pattern})"
+            if pattern.startswith('!'):
                 not_ignored.append(test_file)
             else:
                 ignored_correctly.append(test_file)
@@ -106,31 +206,32 @@ def check_git_status(test_files):
         if ignored_correctly:
             print("✅ FILES CORRECTLY IGNORED:")
             
-            # Group by category
-            backend_files = [f for f in ignored_correctly if f.startswith('backend/')]
-            ios_files = [f for f in ignored_correctly if f.startswith('ios/')]
-            other_files = [f for f in ignored_correctly if not f.startswith(('backend/', 'ios/'))]
+            # Group by category (one pass, input order preserved within each group)
+            backend_files, ios_files, other_files = [], [], []
+            for f in ignored_correctly:
+                if f.startswith(BACKEND_PREFIX):
+                    backend_files.append(f)
+                elif f.startswith(IOS_PREFIX):
+                    ios_files.append(f)
+                else:
+                    other_files.append(f)
             
             if backend_files:
                 print("\n  📦 Backend Files:")
-                for file in backend_files:
-                    print(f"     ✓ {file}")
+                _write_lines([f"     ✓ {file}{rules[file]}" for file in backend_files])
             
             if ios_files:
                 print("\n  📱 iOS/Xcode Files:")
-                for file in ios_files:
-                    print(f"     ✓ {file}")
+                _write_lines([f"     ✓ {file}{rules[file]}" for file in ios_files])
             
             if other_files:
                 print("\n  🔧 Other Files:")
-                for file in other_files:
-                    print(f"     ✓ {file}")
+                _write_lines([f"     ✓ {file}{rules[file]}" for file in other_files])
 
         if not_ignored:
             print("\n❌ FILES NOT IGNORED (ERROR):")
-            for file in not_ignored:
-                print(f"   ✗ {file}")
-            print("\n⚠️  These files should be in .gitignore but are being tracked!")
+            _write_lines([f"   ✗ {file}{rules.get(file, '')}" for file in not_ignored])
+            print("\n⚠️  These files should be in .gitignore but are not ignored by Git!")
 
         # Summary
         print("\n" + "=" * 70)
@@ -153,29 +254,26 @@ def cleanup_test_files(test_files):
     print("Cleaning up test files...")
     print("=" * 70 + "\n")
 
-    cleaned_dirs = set()
-
-    for file_path in test_files:
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                print(f"🗑️  Removed: {file_path}")
-                
-                # Track parent directory for cleanup
-                parent = Path(file_path).parent
-                cleaned_dirs.add(parent)
-                
-        except Exception as e:
-            print(f"⚠️  Failed to remove {file_path}: {e}")
-
-    # Remove empty directories
-    for dir_path in sorted(cleaned_dirs, key=lambda x: len(str(x)), reverse=True):
+    # File removals run on a thread pool; directory removal below stays serial
+    with ThreadPoolExecutor(max_workers=_io_workers(test_files)) as executor:
+        outcomes = list(executor.map(_remove_test_file, test_files))
+
+    lines = []
+    for file_path, outcome in zip(test_files, outcomes):
+        if outcome is True:
+            lines.append(f"🗑️  Removed: {file_path}")
+        elif isinstance(outcome, Exception):
+            lines.append(f"⚠️  Failed to remove {file_path}: {outcome}")
+    _write_lines(lines)
+
+    # Remove empty directories, including intermediate ones such as xcuserdata/:
+    # rmdir itself refuses non-empty or missing directories, so no probe is needed
+    for dir_path in CLEANUP_DIRS:
         try:
-            if dir_path.exists() and not any(dir_path.iterdir()):
-                dir_path.rmdir()
-                print(f"🗑️  Removed empty directory: {dir_path}")
-        except Exception:
-            pass
+            os.rmdir(dir_path)
+        except OSError:
+            continue
+        print(f"🗑️  Removed empty directory: {dir_path}")
 
 
 def main():
@@ -186,11 +284,16 @@ def main():
     print("=" * 70 + "\n")
 
     # Check prerequisites
-    if not os.path.exists('.git'):
+    repo_root = _repo_root()
+    if repo_root is None:
         print("❌ This is not a Git repository!")
         print("Run 'git init' first before testing .gitignore")
         return False
 
+    # Test paths are repo-relative (backend/..., ios/...); run from the top level
+    # so they land in the right place even when invoked from a subdirectory
+    os.chdir(repo_root)
+
     if not os.path.exists('.gitignore'):
         print("❌ .gitignore file not found!")
         print("Please create .gitignore file first")